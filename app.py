@@ -6,74 +6,277 @@ using the OpenFoodFacts public API.
 
 Endpoints:
   POST /scan-barcode   → Fetch product by barcode
+  GET  /scan-barcode?barcode=… → Same, cacheable by browsers / CDNs
   POST /search-product → Search product by name (returns first match)
 """
 
 import os
 import re
+import atexit
+import sys
+import importlib.util
+import gzip
+import hashlib
+import logging
+import logging.handlers
+import queue
+import time
+import functools
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
+import orjson
 import requests
-from flask import Flask, request, jsonify, send_from_directory
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from flask import Flask, Response, request, jsonify, send_from_directory
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from dotenv import load_dotenv
 
 import csv
+import pickle
 
 # ──────────────────────────────────────────────
 # 1. Configuration
 # ──────────────────────────────────────────────
 load_dotenv()  # Load environment variables from .env file
 
+def _gevent_active():
+    """True when running under a gevent worker (threading monkey-patched)."""
+    try:
+        from gevent import monkey
+    except ImportError:
+        return False
+    return monkey.is_module_patched("threading")
+
+# Logging: handlers only enqueue records; a background listener thread does
+# the actual stderr writes, so request threads never block on the stream lock.
+logger = logging.getLogger("nutriscan")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+_log_queue = queue.SimpleQueue()
+_log_stream = logging.StreamHandler(sys.stderr)
+_log_stream.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+_log_listener = None
+
+def _start_log_listener():
+    global _log_listener
+    _log_listener = logging.handlers.QueueListener(_log_queue, _log_stream)
+    _log_listener.start()
+
+def _stop_log_listener():
+    """Flush queued records and stop the listener (safe to call twice)."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+if _gevent_active():
+    # Greenlets don't contend for the stream lock, and a blocking listener
+    # join at shutdown would deadlock the gevent hub: log directly.
+    logger.addHandler(_log_stream)
+else:
+    logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    _start_log_listener()
+    atexit.register(_stop_log_listener)
+    # Threads don't survive fork (gunicorn preload): stop the listener before
+    # forking and restart it on both sides. Unix-only; Windows has no fork.
+    if hasattr(os, "register_at_fork"):
+        os.register_at_fork(
+            before=_stop_log_listener,
+            after_in_parent=_start_log_listener,
+            after_in_child=_start_log_listener,
+        )
+
 # Frontend folder is right next to this file
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 FRONTEND_DIR = os.path.join(BASE_DIR, "Frontend")
+FRONTEND_HTML = "index3nutripro.html"
 ADDITIVES_CSV_PATH = os.path.join(BASE_DIR, "additives.csv")
+ADDITIVES_PKL_PATH = os.path.join(BASE_DIR, "additives.pkl")  # Parsed-CSV cache
+# Bump whenever the row shape built in load_additives_db() changes
+ADDITIVES_CACHE_VERSION = 1
 
 app = Flask(__name__, static_folder=FRONTEND_DIR, static_url_path="/static")
 CORS(app)  # Enable CORS so the frontend can call this API
 
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson (used by jsonify & request.get_json)."""
+
+    # Sorted keys keep output identical to Flask's default provider
+    option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=self.option), mimetype="application/json"
+        )
+
+
+app.json = OrjsonProvider(app)
+
 # Base URLs
 PRODUCT_API_URL = "https://world.openfoodfacts.org/api/v0/product/{barcode}.json"
 SEARCH_API_URL  = "https://world.openfoodfacts.org/cgi/search.pl"
 UPCITEMDB_URL   = "https://api.upcitemdb.com/prod/trial/lookup?upc={barcode}"
 
+# Only ask OFF for the fields we actually read (full products are ~50 KB)
+PRODUCT_FIELDS = ",".join((
+    "product_name", "product_name_en", "image_url",
+    "ingredients_text", "ingredients_text_en", "ingredients",
+    "additives_tags", "categories", "nutriscore_score",
+    "allergens_tags", "ingredients_analysis_tags",
+))
+SEARCH_LIST_FIELDS = "code,id,product_name,brands,image_url,image_small_url,categories"
+BEST_MATCH_FIELDS = "ingredients_text,additives_tags,allergens_tags,nutriscore_score,image_url"
+
 API_KEY = os.getenv("OPENFOODFACTS_API_KEY", "")
 
+# Shared HTTP session: keeps TCP/TLS connections to OFF & UPCitemdb alive
+# between requests instead of reconnecting on every call.
+# Only connection failures are retried (read=0): retrying read timeouts would
+# multiply the per-call timeouts past gunicorn's worker timeout.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_maxsize=32, max_retries=Retry(total=2, read=0, backoff_factor=0.2)),
+)
+
+def _lookup_workers():
+    """
+    Pool size for external lookups: two (OFF + hedged UPCitemdb) per request
+    this process can serve at once, so scans never queue behind each other —
+    queue time would otherwise count against OFF_HEDGE_DELAY.
+    """
+    concurrency = int(os.getenv("GUNICORN_THREADS", 4))
+    if _gevent_active():
+        # Gevent worker: "threads" are greenlets, one scan per connection
+        concurrency = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", 1000))
+    return max(8, 2 * concurrency)
+
+# Worker threads (greenlets under gevent) for firing external lookups in parallel
+_EXECUTOR = ThreadPoolExecutor(max_workers=_lookup_workers())
+
+# Seconds to wait on OFF before also starting the UPCitemdb fallback.
+# Hedging (instead of always firing both) keeps UPCitemdb's small trial
+# quota for real misses.
+OFF_HEDGE_DELAY = 0.3
+
+# Barcode -> product data rarely changes; let clients/CDNs reuse it for a day
+SCAN_CACHE_CONTROL = "public, max-age=86400"
+
+# Max number of barcodes / names kept in each external lookup cache
+LOOKUP_CACHE_SIZE = 4096
+# Seconds before a cached lookup is refetched, so OFF edits show up
+LOOKUP_CACHE_TTL = 3600
+
+# Ingredient separator translate table and barcode pattern, built once at import
+_INGREDIENT_TRANS = str.maketrans({";": ",", "•": ","})
+_BARCODE_RE       = re.compile(r"^\d{4,14}$")
+
 # ──────────────────────────────────────────────
 # 2. Database — Additives (loaded from CSV)
 # ──────────────────────────────────────────────
 ADDITIVES_DB = {}
 
+def _additives_csv_signature():
+    """(mtime, size) of the CSV; any change invalidates the pickle."""
+    st = os.stat(ADDITIVES_CSV_PATH)
+    return (st.st_mtime_ns, st.st_size)
+
+def _load_additives_cache(src):
+    """
+    Return the pickled additives dict if it was built by this cache version
+    from a CSV with signature `src`, otherwise None.
+    """
+    try:
+        with open(ADDITIVES_PKL_PATH, "rb") as f:
+            cached = pickle.load(f)
+        if cached.get("v") != ADDITIVES_CACHE_VERSION or cached.get("src") != src:
+            return None
+        return cached["db"]
+    except Exception:
+        return None
+
+def _save_additives_cache(src):
+    """Write ADDITIVES_DB next to the CSV so later starts can skip parsing."""
+    tmp_path = f"{ADDITIVES_PKL_PATH}.{os.getpid()}.tmp"
+    payload = {"v": ADDITIVES_CACHE_VERSION, "src": src, "db": ADDITIVES_DB}
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # Atomic swap so concurrently starting workers never read a partial file
+        os.replace(tmp_path, ADDITIVES_PKL_PATH)
+    except Exception as e:
+        logger.warning("⚠️ Could not write additives cache: %s", e)
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
 def load_additives_db():
     """
     Load data from additives.csv into a dictionary for fast lookup.
     Key: e_code (normalized to lowercase, e.g. 'e100')
     Value: dict with fields (title, info, e_type, halal_status)
+    Uses additives.pkl instead when it matches the CSV and cache version.
     """
     global ADDITIVES_DB
     if not os.path.exists(ADDITIVES_CSV_PATH):
-        print(f"⚠️ Warning: additives.csv not found at {ADDITIVES_CSV_PATH}")
+        logger.warning("⚠️ additives.csv not found at %s", ADDITIVES_CSV_PATH)
+        return
+
+    # Signature taken before parsing, so a CSV edited mid-load isn't marked fresh
+    src = _additives_csv_signature()
+    cached = _load_additives_cache(src)
+    if cached is not None:
+        ADDITIVES_DB.update(cached)
+        logger.info("✅ Loaded %d additives from cache.", len(ADDITIVES_DB))
         return
 
     try:
         with open(ADDITIVES_CSV_PATH, mode="r", encoding="utf-8", errors="replace") as f:
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
+            # Resolve column positions once from the header row
+            header = next(reader)
+            i_code, i_title, i_info, i_type, i_status = (
+                header.index(name)
+                for name in ("e_code", "title", "info", "e_type", "halal_status")
+            )
+            min_len = max(i_code, i_title, i_info, i_type, i_status) + 1
+            # 'type' / 'status' only take a handful of values across all rows;
+            # share one string object per distinct value
+            pool = {}
+
             for row in reader:
-                code_raw = row.get("e_code", "").strip()
+                if len(row) < min_len:
+                    continue
+                code_raw = row[i_code].strip()
                 if not code_raw:
                     continue
                 
                 # Normalize key: 'E100' -> 'e100'
-                key = code_raw.lower()
+                key = sys.intern(code_raw.lower())
+                e_type = row[i_type].strip()
+                status = row[i_status].strip()
                 ADDITIVES_DB[key] = {
                     "code": code_raw,
-                    "title": row.get("title", "").strip(),
-                    "info": row.get("info", "").strip(),
-                    "type": row.get("e_type", "").strip(),
-                    "status": row.get("halal_status", "").strip()
+                    "title": row[i_title].strip(),
+                    "info": row[i_info].strip(),
+                    "type": pool.setdefault(e_type, e_type),
+                    "status": pool.setdefault(status, status)
                 }
-        print(f"✅ Loaded {len(ADDITIVES_DB)} additives from CSV.")
+        logger.info("✅ Loaded %d additives from CSV.", len(ADDITIVES_DB))
     except Exception as e:
-        print(f"❌ Error loading additives CSV: {e}")
+        logger.error("❌ Error loading additives CSV: %s", e)
+        return
+
+    _save_additives_cache(src)
 
 # Load immediately on startup
 load_additives_db()
@@ -88,7 +291,8 @@ def parse_ingredients(raw_text):
     """
     if not raw_text:
         return []
-    parts = re.split(r"[,;•]", raw_text)
+    # Normalize all separators to ',' so a plain str.split is enough
+    parts = raw_text.translate(_INGREDIENT_TRANS).split(",")
     cleaned = [item.strip() for item in parts if item.strip()]
     return cleaned
 
@@ -96,6 +300,10 @@ def parse_ingredients(raw_text):
 # ──────────────────────────────────────────────
 # 4. Helper — Enrich Additives from DB
 # ──────────────────────────────────────────────
+# Defaults for additives missing from the CSV (code/title filled per tag)
+_UNKNOWN_INFO = "No detailed information available."
+_UNKNOWN_ADDITIVE = {"info": _UNKNOWN_INFO, "type": "Unknown", "status": "Unknown"}
+
 def enrich_additives(additive_tags):
     """
     Given a list of additive tags (e.g. ['en:e330', 'en:e211']),
@@ -108,22 +316,19 @@ def enrich_additives(additive_tags):
 
     for tag in additive_tags:
         # Clean the tag: remove language prefix like "en:" -> "e330"
-        clean_tag = tag.replace("en:", "").strip().lower()
+        clean_tag = tag.strip()
+        if clean_tag.startswith("en:"):
+            clean_tag = clean_tag[3:]
+        clean_tag = clean_tag.lower()
         
         # Lookup in DB
         info = ADDITIVES_DB.get(clean_tag)
         
-        if info:
-            enriched_data.append(info)
-        else:
+        if info is None:
             # Fallback if not found in CSV
-            enriched_data.append({
-                "code": clean_tag.upper(),
-                "title": clean_tag.upper(),
-                "info": "No detailed information available.",
-                "type": "Unknown",
-                "status": "Unknown"
-            })
+            code = clean_tag.upper()
+            info = {"code": code, "title": code, **_UNKNOWN_ADDITIVE}
+        enriched_data.append(info)
 
     return enriched_data
 
@@ -145,24 +350,34 @@ COMMON_ALLERGENS = {
     "sulfites": ["sulfite", "sulphite", "sulfur", "sulphur", "metabisulfite", "dioxide"]
 }
 
+# Flattened once at import: (display category, keyword tuple) pairs
+_ALLERGEN_KEYWORDS = tuple(
+    (allergen.capitalize(), tuple(keywords))
+    for allergen, keywords in COMMON_ALLERGENS.items()
+)
+
 def check_allergens_in_ingredients(ingredients_list):
     """
     Scan the ingredients list for common allergen keywords.
     Returns a list of potential allergens found (e.g. ['Milk', 'Soy']).
     """
-    found = set()
-    # Join list to text for easier searching, or check each item
+    found = []
     text = " ".join(ingredients_list).lower()
-    
-    for allergen, keywords in COMMON_ALLERGENS.items():
+
+    # Plain substring checks (C-level) with an early break per category;
+    # faster here than a combined regex or word-set matching, and keeps
+    # partial hits such as 'nut' in 'peanuts'.
+    for allergen, keywords in _ALLERGEN_KEYWORDS:
         for kw in keywords:
-            # Check for keyword as a whole word or significant part
             if kw in text:
-                found.add(allergen.capitalize())
+                found.append(allergen)
                 break
-    return list(found)# ──────────────────────────────────────────────
+    return found# ──────────────────────────────────────────────
 # 4. Helper — Build a Structured Response
 # ──────────────────────────────────────────────
+def _is_not_none(value):
+    return value is not None
+
 def build_product_response(product):
     """
     Extract and structure only the required fields from an
@@ -181,16 +396,12 @@ def build_product_response(product):
         ings = product.get("ingredients", [])
         if ings:
             # Prefer 'text' from objects that have it, otherwise clean the ID
-            en_names = []
-            for i in ings:
-                txt = i.get("text")
-                if not txt:
-                    # Clean up 'en:sugar' -> 'Sugar'
-                    txt = i.get("id", "").split(":")[-1].replace("-", " ").capitalize()
-                if txt: en_names.append(txt)
-            
-            if en_names:
-                ingredients_raw = ", ".join(en_names)
+            # ('en:sugar' -> 'Sugar'); rpartition avoids building a split list
+            en_names = (
+                i.get("text") or i.get("id", "").rpartition(":")[2].replace("-", " ").capitalize()
+                for i in ings
+            )
+            ingredients_raw = ", ".join(n for n in en_names if n)
     
     if not ingredients_raw:
         # Last resort: generic text field
@@ -210,33 +421,28 @@ def build_product_response(product):
     # Enrich additives with CSV data
     enriched_additives = enrich_additives(additive_tags)
 
-    # Build response, omitting empty/null values
-    response = {}
-
-    if product_name:
-        response["product_name"] = product_name
-    if image_url:
-        response["image"] = image_url
-    if ingredients:
-        response["ingredients"] = ingredients
-    if enriched_additives:
-        response["additives"] = enriched_additives
-
-    # Extra fields for frontend compatibility
-    if categories:
-        response["categories"] = categories
-    if nutriscore is not None:
-        response["nutriscore_score"] = nutriscore
+    # Allergens: prefer API tags, otherwise infer from ingredients
     if allergens_tags:
-        response["allergens_tags"] = [a.replace("en:", "") for a in allergens_tags]
+        allergens = [a[3:] if a.startswith("en:") else a for a in allergens_tags]
     elif ingredients:
-        # Fallback: Infer from ingredients if API has no tags
         inferred = check_allergens_in_ingredients(ingredients)
-        if inferred:
-            response["allergens_tags"] = [f"May contain: {a}" for a in inferred]
-            
-    if ingredients_analysis:
-        response["ingredients_analysis_tags"] = ingredients_analysis
+        allergens = [f"May contain: {a}" for a in inferred]
+    else:
+        allergens = None
+
+    # Build response, omitting empty/null values
+    fields = (
+        ("product_name",              product_name,         bool),
+        ("image",                     image_url,            bool),
+        ("ingredients",               ingredients,          bool),
+        ("additives",                 enriched_additives,   bool),
+        # Extra fields for frontend compatibility
+        ("categories",                categories,           bool),
+        ("nutriscore_score",          nutriscore,           _is_not_none),
+        ("allergens_tags",            allergens,            bool),
+        ("ingredients_analysis_tags", ingredients_analysis, bool),
+    )
+    response = {key: value for key, value, keep in fields if keep(value)}
 
     return response
 
@@ -244,22 +450,81 @@ def build_product_response(product):
 # ──────────────────────────────────────────────
 # 6. Fallback Helpers (UPCitemdb & Search)
 # ──────────────────────────────────────────────
+class _LookupMiss(Exception):
+    """
+    Raised by the cached lookups when the upstream API has no match.
+    lru_cache never stores exceptions, so a product added upstream later
+    is picked up on the next request instead of staying a cached miss.
+    """
+
+def _ttl_lru_cache(maxsize, ttl):
+    """
+    functools.lru_cache whose entries expire after at most `ttl` seconds.
+    The current time bucket is part of the cache key, so entries from an
+    older bucket are never hit again and age out of the LRU.
+    """
+    def decorator(func):
+        cached = functools.lru_cache(maxsize=maxsize)(
+            lambda bucket, *args: func(*args)
+        )
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            return cached(int(time.monotonic() // ttl), *args)
+
+        wrapper.cache_clear = cached.cache_clear
+        wrapper.cache_info = cached.cache_info
+        return wrapper
+    return decorator
+
+@_ttl_lru_cache(maxsize=LOOKUP_CACHE_SIZE, ttl=LOOKUP_CACHE_TTL)
+def _fetch_off_product(barcode):
+    """
+    Fetch the raw OpenFoodFacts product object for a barcode.
+    Raises _LookupMiss if OFF does not know the product.
+    Misses and network/HTTP errors are raised (not cached) so later calls retry.
+    The returned dict is shared by the cache — copy it before mutating.
+    """
+    headers = {}
+    if API_KEY:
+        headers["Authorization"] = f"Bearer {API_KEY}"
+
+    resp = _SESSION.get(
+        PRODUCT_API_URL.format(barcode=barcode),
+        params={"fields": PRODUCT_FIELDS},
+        headers=headers,
+        timeout=10
+    )
+    resp.raise_for_status()
+    api_data = orjson.loads(resp.content)
+    if api_data.get("status") != 1:
+        raise _LookupMiss(barcode)
+    return api_data.get("product", {})
+
+@_ttl_lru_cache(maxsize=LOOKUP_CACHE_SIZE, ttl=LOOKUP_CACHE_TTL)
+def _lookup_upcitemdb(barcode):
+    """Cached UPCitemdb lookup. Misses and errors are raised so they are not cached."""
+    resp = _SESSION.get(UPCITEMDB_URL.format(barcode=barcode), timeout=5)
+    resp.raise_for_status()
+    data = orjson.loads(resp.content)
+    if not data.get("items"):
+        raise _LookupMiss(barcode)
+    item = data["items"][0]
+    return {
+        "product_name": item.get("title", ""),
+        "image_url": item.get("images", [""])[0] if item.get("images") else "",
+    }
+
 def fetch_upcitemdb(barcode):
     """
     Fallback to UPCitemdb to get product name/image if OFF fails.
     """
     try:
-        resp = requests.get(UPCITEMDB_URL.format(barcode=barcode), timeout=5)
-        if resp.status_code == 200:
-            data = resp.json()
-            if data.get("items"):
-                item = data["items"][0]
-                return {
-                    "product_name": item.get("title", ""),
-                    "image_url": item.get("images", [""])[0] if item.get("images") else "",
-                }
+        return _lookup_upcitemdb(barcode)
+    except _LookupMiss:
+        pass
     except Exception as e:
-        print(f"⚠️ UPCitemdb fallback failed: {e}")
+        logger.warning("⚠️ UPCitemdb fallback failed: %s", e)
     return None
 
 def search_products_list(name, limit=20):
@@ -268,110 +533,131 @@ def search_products_list(name, limit=20):
     Used for the manual Search feature so user can choose.
     """
     try:
-        resp = requests.get(
+        resp = _SESSION.get(
             SEARCH_API_URL,
-            params={"search_terms": name, "search_simple": 1, "json": 1, "page_size": limit},
+            params={
+                "search_terms": name, "search_simple": 1, "json": 1,
+                "page_size": limit, "fields": SEARCH_LIST_FIELDS,
+            },
             timeout=8
         )
         if resp.status_code == 200:
-            data = resp.json()
+            data = orjson.loads(resp.content)
             products = data.get("products", [])
             
-            # Format results for frontend
-            results = []
-            for p in products:
-                # Essential fields only
-                results.append({
+            # Format results for frontend: essential fields only, one pass.
+            # The second lookup of each 'or' pair runs only if the first is empty.
+            return [
+                {
                     "barcode": p.get("code") or p.get("id", ""),
                     "product_name": p.get("product_name", "Unknown Product"),
                     "brand": p.get("brands", ""),
-                    "image": p.get("image_url", "") or p.get("image_small_url", ""),
+                    "image": p.get("image_url") or p.get("image_small_url", ""),
                     "categories": p.get("categories", "")
-                })
-            return results
+                }
+                for p in products
+            ]
     except Exception as e:
-        print(f"⚠️ OFF Search list failed: {e}")
+        logger.warning("⚠️ OFF Search list failed: %s", e)
     return []
 
+@_ttl_lru_cache(maxsize=LOOKUP_CACHE_SIZE, ttl=LOOKUP_CACHE_TTL)
+def _search_best_match(name):
+    """Cached OFF name search. Misses and errors are raised so they are not cached."""
+    resp = _SESSION.get(
+        SEARCH_API_URL,
+        params={
+            "search_terms": name, "search_simple": 1, "json": 1,
+            "page_size": 10, "fields": BEST_MATCH_FIELDS,
+        },
+        timeout=8
+    )
+    resp.raise_for_status()
+    data = orjson.loads(resp.content)
+    products = data.get("products", [])
+
+    if not products:
+        raise _LookupMiss(name)
+
+    # Strategy: Look for the best quality data
+    # 1. Any product with explicit ingredients text
+    for p in products:
+        if p.get("ingredients_text"):
+            return p
+
+    # 2. Fallback: Just take the first result
+    return products[0]
+
 def find_best_match_by_name(name):
     """
     Search OpenFoodFacts by name and auto-select the best match (with ingredients).
     Used for the Scan Fallback logic.
     """
     try:
-        resp = requests.get(
-            SEARCH_API_URL,
-            params={"search_terms": name, "search_simple": 1, "json": 1, "page_size": 10},
-            timeout=8
-        )
-        if resp.status_code == 200:
-            data = resp.json()
-            products = data.get("products", [])
-            
-            if not products:
-                return None
-
-            # Strategy: Look for the best quality data
-            # 1. Any product with explicit ingredients text
-            for p in products:
-                if p.get("ingredients_text"):
-                    return p
-            
-            # 2. Fallback: Just take the first result
-            return products[0]
-
+        return _search_best_match(name)
+    except _LookupMiss:
+        pass
     except Exception as e:
-        print(f"⚠️ OFF Best Match fallback failed: {e}")
+        logger.warning("⚠️ OFF Best Match fallback failed: %s", e)
     return None
 
 
 # ──────────────────────────────────────────────
-# 5. Endpoint — POST /scan-barcode
+# 5. Endpoint — GET/POST /scan-barcode
 # ──────────────────────────────────────────────
-@app.route("/scan-barcode", methods=["POST"])
+@app.route("/scan-barcode", methods=["GET", "POST"])
 def scan_barcode():
     """
     Accepts JSON: { "barcode": "1234567890123" }
+    (or GET ?barcode=1234567890123, which HTTP caches can store).
     Returns structured product data or an error.
+    Successful GET responses carry an ETag and Cache-Control header.
     """
 
     # --- 5a. Validate request body ---
-    data = request.get_json(silent=True)
+    if request.method == "GET":
+        data = request.args
+        missing_msg = "Missing 'barcode' query parameter"
+    else:
+        data = request.get_json(silent=True)
+        missing_msg = "Missing 'barcode' field in request body"
     if not data or "barcode" not in data:
-        return jsonify({"error": "Missing 'barcode' field in request body"}), 400
+        return jsonify({"error": missing_msg}), 400
 
     barcode = str(data["barcode"]).strip()
     if not barcode:
         return jsonify({"error": "Barcode cannot be empty"}), 400
 
     # Basic barcode format check (digits only, 8-13 chars typical)
-    if not re.match(r"^\d{4,14}$", barcode):
+    if not _BARCODE_RE.match(barcode):
         return jsonify({"error": "Invalid barcode format. Must be 4-14 digits."}), 400
 
     # --- 5b. Call external API (OpenFoodFacts) ---
+    # If OFF hasn't answered within OFF_HEDGE_DELAY, UPCitemdb is started in
+    # parallel so a slow miss costs ~max(t_off, t_upc) instead of the sum.
     product = {} 
     found_in_off = False
-    
-    try:
-        url = PRODUCT_API_URL.format(barcode=barcode)
-        headers = {}
-        if API_KEY:
-            headers["Authorization"] = f"Bearer {API_KEY}"
-
-        resp = requests.get(url, headers=headers, timeout=10)
-        if resp.status_code == 200:
-            api_data = resp.json()
-            if api_data.get("status") == 1:
-                product = api_data.get("product", {})
-                found_in_off = True
+    f_off = _EXECUTOR.submit(_fetch_off_product, barcode)
+    f_upc = None
 
+    try:
+        try:
+            off_product = f_off.result(timeout=OFF_HEDGE_DELAY)
+        except FuturesTimeout:
+            f_upc = _EXECUTOR.submit(fetch_upcitemdb, barcode)
+            off_product = f_off.result()
+        # Copy: the cached object must not pick up the fallback merges below
+        product = dict(off_product)
+        found_in_off = True
+    except _LookupMiss:
+        pass
     except Exception as e:
-        print(f"⚠️ Main API Error: {e}")
+        logger.warning("⚠️ Main API Error: %s", e)
 
     # --- 5c. Fallback 1: UPCitemdb (if not found in OFF) ---
     if not found_in_off:
-        print("Product not found in OFF, trying UPCitemdb...")
-        upc_data = fetch_upcitemdb(barcode)
+        logger.info("Product %s not found in OFF, using UPCitemdb...", barcode)
+        upc_data = f_upc.result() if f_upc else fetch_upcitemdb(barcode)
         if upc_data:
             product.update(upc_data) # Use name/image from UPCitemdb
     
@@ -379,7 +665,7 @@ def scan_barcode():
     # Case: We have a Name (from OFF or UPCitemdb) but NO ingredients.
     # We search OFF by name to find a sibling product with data.
     if product.get("product_name") and not product.get("ingredients_text"):
-        print(f"Missing ingredients for '{product['product_name']}', searching by name...")
+        logger.info("Missing ingredients for '%s', searching by name...", product["product_name"])
         sibling = find_best_match_by_name(product["product_name"])
         if sibling:
             # Merge fields if missing in original
@@ -405,7 +691,20 @@ def scan_barcode():
     if not result:
         return jsonify({"error": "Product found but contains no usable data"}), 404
 
-    return jsonify(result), 200
+    # --- 5f. HTTP caching (GET only): ETag from the body, 304 if the client has it ---
+    # POST responses aren't cacheable, and a conditional POST must never get a 304.
+    if request.method != "GET":
+        return jsonify(result), 200
+
+    body = orjson.dumps(result, option=OrjsonProvider.option)
+    etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+    headers = {"ETag": f'"{etag}"', "Cache-Control": SCAN_CACHE_CONTROL}
+
+    # If-None-Match uses weak comparison (proxies that gzip weaken our ETag)
+    if request.if_none_match.contains_weak(etag):
+        return Response(status=304, headers=headers)
+
+    return Response(body, status=200, mimetype="application/json", headers=headers)
 
 
 # ──────────────────────────────────────────────
@@ -438,10 +737,48 @@ def search_product():
 # ──────────────────────────────────────────────
 # 7. Serve Frontend & Health Check
 # ──────────────────────────────────────────────
+def _load_frontend():
+    """
+    Read the frontend page once and pre-compress it.
+    Returns (raw, gzipped, etag), or None if the file is missing.
+    """
+    try:
+        with open(os.path.join(FRONTEND_DIR, FRONTEND_HTML), "rb") as f:
+            html = f.read()
+    except OSError as e:
+        logger.warning("⚠️ Could not read frontend page: %s", e)
+        return None
+    return html, gzip.compress(html, 9), hashlib.blake2b(html, digest_size=16).hexdigest()
+
+_FRONTEND = _load_frontend()
+
+
 @app.route("/", methods=["GET"])
 def serve_frontend():
-    """Serve the main frontend HTML page."""
-    return send_from_directory(FRONTEND_DIR, "index3nutripro.html")
+    """Serve the main frontend HTML page (cached in memory, gzip if accepted)."""
+    # In debug mode read from disk so edits show up without a restart
+    if _FRONTEND is None or app.debug:
+        return send_from_directory(FRONTEND_DIR, FRONTEND_HTML)
+
+    html, html_gz, etag = _FRONTEND
+    headers = {"Vary": "Accept-Encoding"}
+
+    # Honour q-values: 'gzip;q=0' means the client refuses gzip
+    if request.accept_encodings["gzip"] > 0:
+        # Strong ETags must differ per representation
+        etag = f"{etag}-gz"
+        headers["Content-Encoding"] = "gzip"
+        body = html_gz
+    else:
+        body = html
+    headers["ETag"] = f'"{etag}"'
+
+    # If-None-Match uses weak comparison (proxies may weaken our ETag)
+    if request.if_none_match.contains_weak(etag):
+        headers.pop("Content-Encoding", None)  # No body on a 304
+        return Response(status=304, headers=headers)
+
+    return Response(body, mimetype="text/html", headers=headers)
 
 
 @app.route("/health", methods=["GET"])
@@ -456,5 +793,16 @@ def health():
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 5000))
     debug = os.getenv("FLASK_DEBUG", "true").lower() == "true"
-    print(f"\n🚀 NutriScan API running on http://localhost:{port}\n")
+    logger.info("🚀 NutriScan API running on http://localhost:%d", port)
+
+    # Outside debug mode hand over to gunicorn (multi-worker) when installed;
+    # Flask's dev server is only meant for local development.
+    # Run it as `python -m gunicorn` under this interpreter so it never picks
+    # up a gunicorn from another virtualenv on PATH.
+    if not debug and importlib.util.find_spec("gunicorn"):
+        _stop_log_listener()  # Flush queued log records before exec replaces us
+        os.execv(sys.executable, [
+            sys.executable, "-m", "gunicorn", "--chdir", BASE_DIR,
+            "-c", os.path.join(BASE_DIR, "gunicorn.conf.py"), "app:app",
+        ])
     app.run(host="0.0.0.0", port=port, debug=debug)
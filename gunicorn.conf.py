@@ -0,0 +1,30 @@
+"""
+Gunicorn settings for running NutriScan in production.
+
+  gunicorn -c gunicorn.conf.py app:app
+
+preload_app loads additives.csv once in the master; forked workers share
+ADDITIVES_DB copy-on-write instead of each parsing their own copy.
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+# Capped default: in containers cpu_count() reports host CPUs, and each worker
+# carries its own lookup caches and executor threads. Raise via WEB_CONCURRENCY.
+workers = int(os.getenv("WEB_CONCURRENCY", min(multiprocessing.cpu_count() * 2 + 1, 4)))
+# "gthread" (default) or "gevent". With gevent every blocking OFF/UPCitemdb
+# call yields to the event loop, so one worker can hold hundreds of scans
+# in flight (requires `pip install gevent`). app.py sizes its lookup pool
+# from GUNICORN_THREADS / GUNICORN_WORKER_CONNECTIONS to match.
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+threads = int(os.getenv("GUNICORN_THREADS", 4))  # Requests mostly wait on OFF/UPCitemdb
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", 1000))
+
+if worker_class == "gevent":
+    # Must patch before preload_app imports the app (and ssl via requests)
+    from gevent import monkey
+    monkey.patch_all()
+preload_app = True
+timeout = 30